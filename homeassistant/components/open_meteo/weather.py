@@ -6,7 +6,7 @@ from open_meteo import Forecast as OpenMeteoForecast
 from homeassistant.components.weather import Forecast, WeatherEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfPrecipitationDepth, UnitOfSpeed, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceEntryType
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -47,6 +47,7 @@ class OpenMeteoWeatherEntity(
         """Initialize Open-Meteo weather entity."""
         super().__init__(coordinator=coordinator)
         self._attr_unique_id = entry.entry_id
+        self._forecasts: list[Forecast] | None = None
 
         self._attr_device_info = DeviceInfo(
             entry_type=DeviceEntryType.SERVICE,
@@ -55,69 +56,66 @@ class OpenMeteoWeatherEntity(
             name=entry.title,
         )
 
-    @property
-    def condition(self) -> str | None:
-        """Return the current condition."""
-        if not self.coordinator.data.current_weather:
-            return None
-        return WMO_TO_HA_CONDITION_MAP.get(
-            self.coordinator.data.current_weather.weather_code
-        )
-
-    @property
-    def native_temperature(self) -> float | None:
-        """Return the platform temperature."""
-        if not self.coordinator.data.current_weather:
-            return None
-        return self.coordinator.data.current_weather.temperature
-
-    @property
-    def native_wind_speed(self) -> float | None:
-        """Return the wind speed."""
-        if not self.coordinator.data.current_weather:
-            return None
-        return self.coordinator.data.current_weather.wind_speed
-
-    @property
-    def wind_bearing(self) -> float | str | None:
-        """Return the wind bearing."""
-        if not self.coordinator.data.current_weather:
-            return None
-        return self.coordinator.data.current_weather.wind_direction
+        self._async_update_attrs()
+
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update the entity attributes from the latest coordinator data."""
+        if (current_weather := self.coordinator.data.current_weather) is None:
+            self._attr_condition = None
+            self._attr_native_temperature = None
+            self._attr_native_wind_speed = None
+            self._attr_wind_bearing = None
+            return
+
+        self._attr_condition = WMO_TO_HA_CONDITION_MAP.get(current_weather.weather_code)
+        self._attr_native_temperature = current_weather.temperature
+        self._attr_native_wind_speed = current_weather.wind_speed
+        self._attr_wind_bearing = current_weather.wind_direction
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._forecasts = None
+        self._async_update_attrs()
+        super()._handle_coordinator_update()
 
     @property
     def forecast(self) -> list[Forecast] | None:
         """Return the forecast in native units."""
-        if self.coordinator.data.daily is None:
-            return None
+        if self._forecasts is not None:
+            return self._forecasts
 
-        forecasts: list[Forecast] = []
-        daily = self.coordinator.data.daily
-        for index, time in enumerate(self.coordinator.data.daily.time):
-            forecast = Forecast(
-                datetime=time.isoformat(),
-            )
+        if (daily := self.coordinator.data.daily) is None:
+            return None
 
-            if daily.weathercode is not None:
-                forecast["condition"] = WMO_TO_HA_CONDITION_MAP.get(
-                    daily.weathercode[index]
-                )
+        forecasts = [Forecast(datetime=time.isoformat()) for time in daily.time]
 
-            if daily.precipitation_sum is not None:
-                forecast["native_precipitation"] = daily.precipitation_sum[index]
+        if daily.weathercode is not None:
+            for forecast, weathercode in zip(forecasts, daily.weathercode):
+                forecast["condition"] = WMO_TO_HA_CONDITION_MAP.get(weathercode)
 
-            if daily.temperature_2m_max is not None:
-                forecast["native_temperature"] = daily.temperature_2m_max[index]
+        if daily.precipitation_sum is not None:
+            for forecast, precipitation in zip(forecasts, daily.precipitation_sum):
+                forecast["native_precipitation"] = precipitation
 
-            if daily.temperature_2m_min is not None:
-                forecast["native_templow"] = daily.temperature_2m_min[index]
+        if daily.temperature_2m_max is not None:
+            for forecast, temperature in zip(forecasts, daily.temperature_2m_max):
+                forecast["native_temperature"] = temperature
 
-            if daily.wind_direction_10m_dominant is not None:
-                forecast["wind_bearing"] = daily.wind_direction_10m_dominant[index]
+        if daily.temperature_2m_min is not None:
+            for forecast, templow in zip(forecasts, daily.temperature_2m_min):
+                forecast["native_templow"] = templow
 
-            if daily.wind_speed_10m_max is not None:
-                forecast["native_wind_speed"] = daily.wind_speed_10m_max[index]
+        if daily.wind_direction_10m_dominant is not None:
+            for forecast, wind_bearing in zip(
+                forecasts, daily.wind_direction_10m_dominant
+            ):
+                forecast["wind_bearing"] = wind_bearing
 
-            forecasts.append(forecast)
+        if daily.wind_speed_10m_max is not None:
+            for forecast, wind_speed in zip(forecasts, daily.wind_speed_10m_max):
+                forecast["native_wind_speed"] = wind_speed
 
+        self._forecasts = forecasts
         return forecasts